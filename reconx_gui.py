@@ -14,7 +14,9 @@ Change‑log
 """
 
 from __future__ import annotations
-import sys, os, subprocess, base64, textwrap
+import sys, os, io, shlex, shutil, subprocess, base64, textwrap, threading
+import functools, hashlib, re, time
+from datetime import date
 from pathlib import Path
 
 # ───────────────────────── GUI availability check ────────────────────────────
@@ -28,19 +30,21 @@ if os.name == "posix" and not os.environ.get("DISPLAY"):
 
 # ────────────────────────────── Qt / deps import ─────────────────────────────
 try:
-    from PyQt5.QtCore import Qt, QThread, pyqtSignal
-    from PyQt5.QtGui import QPixmap, QIcon, QFont
+    from PyQt5.QtCore import (
+        Qt, QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool,
+        pyqtSignal
+    )
+    from PyQt5.QtGui import QPixmap, QPixmapCache, QIcon, QFont
     from PyQt5.QtWidgets import (
         QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-        QPushButton, QListWidget, QListWidgetItem, QTextEdit,
-        QFileDialog, QMessageBox, QProgressBar, QSplitter, QInputDialog
+        QPushButton, QListView, QPlainTextEdit,
+        QFileDialog, QMessageBox, QProgressBar, QSplitter, QInputDialog,
+        QSpinBox, QCheckBox
     )
 except ImportError:
-    sys.stderr.write("[!] PyQt5 not installed – run: python -m pip install PyQt5 termcolor\n")
+    sys.stderr.write("[!] PyQt5 not installed – run: python -m pip install PyQt5\n")
     sys.exit(1)
 
-from termcolor import colored
-
 # ─────────────────────────────── Module catalog ──────────────────────────────
 MODULES = {
     1: ("WHOIS",          "whois {target}"),
@@ -61,6 +65,37 @@ MODULES = {
 }
 REQUIRED_TOOLS = [cmd.split()[0] for _, cmd in MODULES.values()]
 
+# Command templates pre-split into argv tuples once at import – none of the
+# commands use shell features, so the tools are exec'd directly without a
+# `/bin/sh -c` wrapper per module.
+_MODULE_ARGV = {mid: (name, tuple(shlex.split(raw)))
+                for mid, (name, raw) in MODULES.items()}
+
+# Hostname / IP (optionally host:port) – the target is substituted into the
+# pre-split argv, so it must never carry spaces or shell metacharacters and
+# must not start with "-" (which the tools would parse as an option).
+_TARGET_RE = re.compile(r"^[A-Za-z0-9\[][A-Za-z0-9._:\-\[\]]*$")
+
+# One `which` pass at startup – modules whose binary is missing are greyed
+# out in the UI and short-circuited in Runner without paying a fork+exec.
+_TOOL_PATH = {t: shutil.which(t) for t in set(REQUIRED_TOOLS)}
+
+# How long a cached module result stays valid, in seconds. WHOIS/DNS data
+# barely moves day to day; vuln scanners go stale much faster.
+_CACHE_TTL_DEFAULT = 6 * 3600
+_CACHE_TTL = {
+    1: 24 * 3600,   # WHOIS
+    3: 24 * 3600,   # Subfinder
+    4: 24 * 3600,   # DNSRecon
+    8: 3600,        # Nuclei
+}
+
+# Linux fast paths – splice(2) moves pipe bytes into the cache file without
+# copying through userspace; sendfile(2) does the same for the file→report
+# append. Both degrade gracefully where the os module doesn't expose them.
+_HAS_SPLICE = hasattr(os, "splice")
+_HAS_SENDFILE = hasattr(os, "sendfile")
+
 # ──────────────────────────────── Logo handling ──────────────────────────────
 LOGO_FILE = "logo_reconx.png"  # drop your image next to the script or adjust the path
 
@@ -69,60 +104,348 @@ _FALLBACK_SVG = (
     "ZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48Y2lyY2xlIGN4PSIzMiIgY3k9"
     "IjMyIiByPSIyOCIgZmlsbD0iI0ZGRiIvPjwvc3ZnPg=="
 )
+_FALLBACK_SVG_BYTES = base64.b64decode(_FALLBACK_SVG)
+
+# Resolved (and stat'ed) once at import – None means "use the fallback SVG".
+_LOGO_PATH = Path(__file__).with_name(LOGO_FILE)
+if not _LOGO_PATH.is_file():
+    _LOGO_PATH = None
 
+@functools.lru_cache(maxsize=1)
 def _logo_pixmap() -> QPixmap:
-    """Return a QPixmap built from LOGO_FILE (preferred) or fallback SVG."""
+    """Return a QPixmap built from LOGO_FILE (preferred) or fallback SVG.
+
+    Cached – the window icon and header label share one instance instead of
+    decoding the image on every call.
+    """
     px = QPixmap()
-    img = Path(__file__).with_name(LOGO_FILE)
-    if img.is_file():
-        px.load(str(img))
+    if _LOGO_PATH is not None:
+        px.load(str(_LOGO_PATH))
     else:
-        px.loadFromData(base64.b64decode(_FALLBACK_SVG))
+        px.loadFromData(_FALLBACK_SVG_BYTES)
     return px
 
-# ────────────────────────────── Worker thread (Runner) ───────────────────────
-class Runner(QThread):
+def _logo48() -> QPixmap:
+    """48 px header variant – bilinear-scaled once, then served from
+    QPixmapCache."""
+    px = QPixmapCache.find("reconx/logo48")
+    if px is None or px.isNull():
+        px = _logo_pixmap().scaledToHeight(48, Qt.SmoothTransformation)
+        QPixmapCache.insert("reconx/logo48", px)
+    return px
+
+# ──────────────────────────────── Theme (QSS) ────────────────────────────────
+# Applied once on the QApplication so Qt caches style lookups globally and
+# secondary dialogs (QInputDialog, QMessageBox) pick up the theme for free.
+_THEME_QSS = textwrap.dedent("""
+    * { background:#1e1e1e; color:#dcdcdc; font-family:Arial,Helvetica,sans-serif; }
+    QPushButton { background:#333; border:1px solid #444; padding:6px 12px; }
+    QPushButton:hover { background:#444; }
+    QPushButton:disabled { background:#555; color:#888; }
+    QPlainTextEdit, QListView { background:#121212; }
+    QProgressBar { background:#121212; border:1px solid #444; text-align:center; }
+""")
+
+# ─────────────────────────── Worker pool (ModuleJob) ─────────────────────────
+class _LogBatcher:
+    """Coalesces raw output bytes into ~50 ms batches of log lines.
+
+    One queued signal per batch instead of one per line keeps the GUI thread
+    responsive when a chatty tool emits tens of thousands of lines; decoding
+    happens once per batch, not per line.
+    """
+
+    def __init__(self, log):
+        self.log = log
+        self.leftover = b""
+        self.batch: list[bytes] = []
+        self.last_flush = time.monotonic()
+
+    def feed(self, data: bytes):
+        lines = (self.leftover + data).split(b"\n")
+        self.leftover = lines.pop()
+        self.batch.extend(line.rstrip() for line in lines)
+        now = time.monotonic()
+        if len(self.batch) >= 64 or (self.batch and now - self.last_flush > 0.05):
+            self._flush(now)
+
+    def close(self):
+        if self.leftover:
+            self.batch.append(self.leftover.rstrip())
+            self.leftover = b""
+        if self.batch:
+            self._flush(time.monotonic())
+
+    def _flush(self, now: float):
+        self.log.emit(b"\n".join(self.batch).decode("utf-8", "replace"))
+        self.batch.clear()
+        self.last_flush = now
+
+
+class RunnerSignals(QObject):
+    """Signal hub shared by every module job.
+
+    One instance lives for the whole application, so the queued connections
+    into the GUI thread are set up exactly once and reused across runs.
+    """
     log      = pyqtSignal(str)
     progress = pyqtSignal(int)
-    done_one = pyqtSignal(str, str)
     done_all = pyqtSignal(Path)
 
-    def __init__(self, target: str, ids: list[int], outdir: Path):
-        super().__init__()
+
+class RunContext:
+    """Shared state for one ▶ Run click: report handle, counters, cache."""
+
+    def __init__(self, target: str, total: int, outdir: Path,
+                 signals: RunnerSignals, ignore_cache: bool = False):
         self.target = target
-        self.ids = ids
-        self.outdir = outdir
+        self.total = total
+        self.signals = signals
+        self.ignore_cache = ignore_cache
+        self.cache_dir = outdir.parent / ".reconx_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.combined_path = outdir / f"{target.replace(':', '_')}_recon.txt"
+        # Binary mode with a 1 MiB buffer – module output is appended as raw
+        # bytes, so there is no per-line text codec and far fewer syscalls.
+        self.combo = self.combined_path.open("wb", buffering=1024 * 1024)
+        self.combo.write(f"RECONX Combined Report – {target}\n".encode("utf-8"))
+        self.combo.write(b"=" * 80 + b"\n\n")
+        self.lock = threading.Lock()
+        self.done = 0
+        self._last_pct = -1
+
+    def cached_output(self, mid: int, cache_file: Path) -> bytes | None:
+        """Return the cached result for a module, or None if absent/stale."""
+        if self.ignore_cache:
+            return None
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+        except OSError:
+            return None
+        if age >= _CACHE_TTL.get(mid, _CACHE_TTL_DEFAULT):
+            return None
+        return cache_file.read_bytes()
+
+    def _advance(self):
+        """Bump the completion counter; close the report after the last module."""
+        self.done += 1
+        done = self.done
+        # Integer percentage, emitted only when it changes – setValue forces
+        # a repaint, so duplicate values are pure waste.
+        pct = (done * 100) // self.total
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.signals.progress.emit(pct)
+        if done == self.total:
+            self.combo.close()
+            self.signals.done_all.emit(self.combined_path)
+
+    def finish_module(self, header: str, output: bytes | Path):
+        """Append one module's section to the combined report.
+
+        ``output`` is either raw bytes or a Path to a file-backed section
+        (cache entry), which is appended kernel-side via sendfile where
+        available.
+        """
+        with self.lock:
+            self.combo.write(header.encode("utf-8"))
+            if isinstance(output, Path):
+                self._append_file(output)
+            else:
+                self.combo.write(output)
+            self.combo.write(b"\n" + (b"=" * 80) + b"\n\n")
+            self._advance()
+
+    def _append_file(self, path: Path):
+        """Copy a section file into the report without buffering it whole."""
+        self.combo.flush()  # fd offset must match the buffered position
+        with path.open("rb") as src:
+            if _HAS_SENDFILE:
+                size = os.fstat(src.fileno()).st_size
+                off = 0
+                while off < size:
+                    sent = os.sendfile(self.combo.fileno(), src.fileno(),
+                                       off, size - off)
+                    if sent == 0:
+                        break
+                    off += sent
+            else:
+                shutil.copyfileobj(src, self.combo, 1024 * 1024)
+
+
+class ModuleJob(QRunnable):
+    """Runs a single recon module's subprocess on a pool thread.
+
+    Jobs are submitted to one long-lived QThreadPool instead of spinning up a
+    fresh QThread per run, so repeated runs reuse the same OS threads.
+    """
+
+    def __init__(self, mid: int, ctx: RunContext):
+        super().__init__()
+        self.mid = mid
+        self.ctx = ctx
 
     def run(self):
-        # Single combined output file for this run
-        combined_path = self.outdir / f"{self.target.replace(':', '_')}_recon.txt"
-        total = len(self.ids)
-        with combined_path.open("w", encoding="utf-8", errors="ignore") as combo:
-            combo.write(f"RECONX Combined Report – {self.target}\n")
-            combo.write("=" * 80 + "\n\n")
-            for idx, mid in enumerate(self.ids, 1):
-                if mid not in MODULES:
-                    msg = colored(f"[!] Skipping invalid module ID: {mid}", "red")
-                    self.log.emit(msg)
-                    combo.write(msg + "\n")
-                    continue
-                name, raw = MODULES[mid]
-                cmd = raw.format(target=self.target)
-                # ── Header per module ──
-                header = f"[+] MODULE {mid} – {name}\nCOMMAND: {cmd}\n" + ("-" * 80) + "\n"
-                self.log.emit("\n" + colored(header, "cyan"))
-                combo.write(header)
-                # ── Run the process ──
-                proc = subprocess.Popen(cmd, shell=True, text=True,
-                                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                for line in proc.stdout:
-                    self.log.emit(line.rstrip())
-                    combo.write(line)
-                proc.wait()
-                combo.write("\n" + ("=" * 80) + "\n\n")
-                self.done_one.emit(name, str(combined_path))
-                self.progress.emit(int(idx / total * 100))
-        self.done_all.emit(combined_path)
+        try:
+            header, output = self._execute()
+        except Exception as exc:  # a worker failure must never stall the run
+            name = _MODULE_ARGV[self.mid][0]
+            header = f"[+] MODULE {self.mid} – {name}\n" + ("-" * 80) + "\n"
+            output = f"[!] module crashed: {exc}\n".encode("utf-8")
+            self.ctx.signals.log.emit(f"[!] {name} crashed: {exc}")
+        self.ctx.finish_module(header, output)
+
+    def _execute(self) -> tuple[str, bytes | Path]:
+        """Run the module's subprocess, buffering its output locally.
+
+        Stdout is accumulated in a job-local buffer so concurrent modules
+        never interleave in the report.
+        """
+        ctx = self.ctx
+        log = ctx.signals.log
+        name, tmpl = _MODULE_ARGV[self.mid]
+        argv = tuple(a.replace("{target}", ctx.target) for a in tmpl)
+        header = f"[+] MODULE {self.mid} – {name}\nCOMMAND: {' '.join(argv)}\n" + ("-" * 80) + "\n"
+        log.emit("\n" + header)
+        if _TOOL_PATH.get(argv[0]) is None:
+            msg = f"[!] {argv[0]}: not installed – module skipped\n"
+            log.emit(msg.rstrip())
+            return header, msg.encode("utf-8")
+        # ── Cache lookup – results are keyed per command, target and day ──
+        key = hashlib.sha256(f"{' '.join(argv)}|{ctx.target}|{date.today()}".encode()).hexdigest()
+        cache_file = ctx.cache_dir / f"{key}.txt"
+        cached = ctx.cached_output(self.mid, cache_file)
+        if cached is not None:
+            log.emit(f"[cache] {name}: reusing previous result")
+            log.emit(cached.decode("utf-8", "replace").rstrip())
+            return header, cache_file
+        try:
+            proc = subprocess.Popen(argv,
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        except FileNotFoundError:
+            msg = f"[!] {argv[0]}: command not found – skipping module\n"
+            log.emit(msg.rstrip())
+            return header, msg.encode("utf-8")
+        batcher = _LogBatcher(log)
+        tmp = cache_file.with_suffix(".tmp")
+        try:
+            if _HAS_SPLICE:
+                # Linux: move pipe bytes straight into the cache file kernel-
+                # side. "w+b" – _splice_stream preads each freshly written
+                # span back for the log, so the sink fd must be readable too.
+                with tmp.open("w+b") as sink:
+                    spliced = self._splice_stream(proc, sink.fileno(), batcher)
+                if spliced:
+                    batcher.close()
+                    proc.wait()
+                    if proc.returncode == 0:
+                        # Atomic cache fill: temp file renamed into place; the
+                        # report section is appended from the file via sendfile.
+                        tmp.replace(cache_file)
+                        return header, cache_file
+                    # Failed run – goes into the report, never into the cache.
+                    return header, tmp.read_bytes()
+                # splice refused this fd pair (exotic fs) – read loop below.
+            # Portable path: read the pipe in 64 KiB chunks via os.read – one
+            # syscall per chunk rather than a buffered readline per newline.
+            buf = io.BytesIO()
+            fd = proc.stdout.fileno()
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                buf.write(chunk)
+                batcher.feed(chunk)
+            batcher.close()
+            proc.wait()
+        except Exception:
+            # Don't leave the tool alive and blocked on a full pipe if
+            # streaming dies mid-run.
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            # Never leave a stale .tmp in the cache dir – nothing else prunes
+            # them (a no-op after a successful replace; the portable path
+            # below recreates it only for cacheable runs).
+            tmp.unlink(missing_ok=True)
+        output = buf.getvalue()
+        if proc.returncode == 0:
+            # Atomic cache fill: write a temp file, then rename into place.
+            # Failed runs still reach the report but are never cached.
+            tmp.write_bytes(output)
+            tmp.replace(cache_file)
+        return header, output
+
+    def _splice_stream(self, proc, sink_fd: int, batcher: _LogBatcher) -> bool:
+        """Zero-copy the subprocess pipe into ``sink_fd`` via splice(2).
+
+        The bulk bytes never enter userspace; only the log tail does, pread
+        back from the file after each splice (the os module exposes no
+        tee(2)). Returns False – before consuming anything – if splice is
+        unsupported for this fd pair, so the caller can fall back.
+        """
+        pipe_fd = proc.stdout.fileno()
+        offset = 0
+        while True:
+            try:
+                n = os.splice(pipe_fd, sink_fd, 65536)
+            except OSError:
+                if offset == 0:
+                    return False
+                raise
+            if n == 0:
+                return True
+            batcher.feed(os.pread(sink_fd, n, offset))
+            offset += n
+
+# ───────────────────────────── Module list model ─────────────────────────────
+class ModuleListModel(QAbstractListModel):
+    """Checkable list model over the MODULES catalog.
+
+    The checked ids live in a set, so the Run handler reads the selection
+    directly instead of polling every row's check state; modules whose
+    binary is missing are shown greyed out and cannot be checked.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = list(MODULES.items())
+        self.checked_ids = {mid for mid, _ in self._rows
+                            if not self._missing(mid)}
+
+    @staticmethod
+    def _missing(mid: int) -> bool:
+        return _TOOL_PATH.get(_MODULE_ARGV[mid][1][0]) is None
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        mid, (name, _) = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"[{mid}] {name}"
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if mid in self.checked_ids else Qt.Unchecked
+        if role == Qt.ToolTipRole and self._missing(mid):
+            return f"{_MODULE_ARGV[mid][1][0]} is not installed"
+        return None
+
+    def setData(self, index, value, role=Qt.CheckStateRole):
+        if role != Qt.CheckStateRole:
+            return False
+        mid = self._rows[index.row()][0]
+        if value == Qt.Checked:
+            self.checked_ids.add(mid)
+        else:
+            self.checked_ids.discard(mid)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if self._missing(self._rows[index.row()][0]):
+            return Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
 
 # ──────────────────────────────── Main window UI ─────────────────────────────
 class MainWindow(QWidget):
@@ -134,8 +457,14 @@ class MainWindow(QWidget):
         self.output_root = Path.cwd() / "results"
         self.output_root.mkdir(exist_ok=True)
         self._build_ui()
-        self._apply_theme()
         self.target = None
+        # One pool + one signal hub for the lifetime of the window – jobs are
+        # submitted per run, threads and connections are reused.
+        self.pool = QThreadPool()
+        self.signals = RunnerSignals()
+        self.signals.log.connect(self.log.appendPlainText)
+        self.signals.progress.connect(self.pb.setValue)
+        self.signals.done_all.connect(self._on_done_all)
 
     # ────────── UI construction ──────────
     def _build_ui(self):
@@ -145,7 +474,7 @@ class MainWindow(QWidget):
         # Header (logo + title + output-dir button)
         hdr = QHBoxLayout()
         lbl_logo = QLabel()
-        lbl_logo.setPixmap(_logo_pixmap().scaledToHeight(48, Qt.SmoothTransformation))
+        lbl_logo.setPixmap(_logo48())
         lbl_title = QLabel("<b style='font-size:28px;'>RECONX</b><br/><small>Automated Red‑Team Recon Engine</small>")
         lbl_title.setTextFormat(Qt.RichText)
         hdr.addWidget(lbl_logo)
@@ -161,13 +490,11 @@ class MainWindow(QWidget):
         splitter.setChildrenCollapsible(False)
         layout.addWidget(splitter, 1)
 
-        # Left: module checklist
-        self.list = QListWidget()
-        self.list.setSelectionMode(QListWidget.MultiSelection)
-        for mid, (name, _) in MODULES.items():
-            item = QListWidgetItem(f"[{mid}] {name}")
-            item.setCheckState(Qt.Checked)
-            self.list.addItem(item)
+        # Left: module checklist (model/view – selection queries are O(1))
+        self.model = ModuleListModel(self)
+        self.list = QListView()
+        self.list.setModel(self.model)
+        self.list.setSelectionMode(QListView.MultiSelection)
         self.list.setMinimumWidth(260)
         splitter.addWidget(self.list)
 
@@ -182,17 +509,30 @@ class MainWindow(QWidget):
         self.lbl_target.setTextInteractionFlags(Qt.TextSelectableByMouse)
         btn_set = QPushButton("Set Target …")
         btn_set.clicked.connect(self.set_target)
+        self.spin_workers = QSpinBox()
+        self.spin_workers.setRange(1, 8)
+        self.spin_workers.setValue(4)
+        self.spin_workers.setToolTip("Number of modules to run concurrently")
+        self.chk_nocache = QCheckBox("Ignore cache")
+        self.chk_nocache.setToolTip("Re-run every module even if a fresh cached result exists")
         self.btn_run = QPushButton("▶ Run")
         self.btn_run.clicked.connect(self.on_run)
         trow.addWidget(self.lbl_target, 1)
         trow.addWidget(btn_set)
+        trow.addWidget(QLabel("Workers:"))
+        trow.addWidget(self.spin_workers)
+        trow.addWidget(self.chk_nocache)
         trow.addWidget(self.btn_run)
         rlayout.addLayout(trow)
 
-        # Log panel
-        self.log = QTextEdit()
+        # Log panel – QPlainTextEdit handles large documents far better than
+        # QTextEdit, and the block cap evicts old lines in O(1) so memory and
+        # per-append cost stay constant on long scans.
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
-        self.log.setLineWrapMode(QTextEdit.NoWrap)
+        self.log.setMaximumBlockCount(5000)
+        self.log.setUndoRedoEnabled(False)
+        self.log.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.log.document().setDefaultFont(QFont("Consolas", 10))
         rlayout.addWidget(self.log, 1)
 
@@ -204,9 +544,15 @@ class MainWindow(QWidget):
     # ────────── Helpers ──────────
     def set_target(self):
         target, ok = QInputDialog.getText(self, "Set Target", "Enter domain or IP:")
-        if ok and target:
-            self.target = target.strip()
-            self.lbl_target.setText(f"<b>Target:</b> {self.target}")
+        if not (ok and target):
+            return
+        target = target.strip()
+        if not _TARGET_RE.match(target):
+            QMessageBox.warning(self, "Invalid Target",
+                                "Target must be a hostname or IP address.")
+            return
+        self.target = target
+        self.lbl_target.setText(f"<b>Target:</b> {self.target}")
 
     def choose_outdir(self):
         path = QFileDialog.getExistingDirectory(self, "Select Output Directory", str(self.output_root))
@@ -217,33 +563,34 @@ class MainWindow(QWidget):
         if not self.target:
             QMessageBox.warning(self, "Target Required", "Please set a target before running.")
             return
-        mids = [i for i in range(self.list.count()) if self.list.item(i).checkState() == Qt.Checked]
-        if not mids:
+        ids = sorted(self.model.checked_ids)
+        if not ids:
             QMessageBox.warning(self, "Select Modules", "Please select at least one module.")
             return
+        # Validate once up front – the workers assume every id is resolvable.
+        invalid = [m for m in ids if m not in MODULES]
+        if invalid:
+            QMessageBox.warning(self, "Invalid Modules",
+                                "Ignoring unknown module ids: " + ", ".join(map(str, invalid)))
+            ids = [m for m in ids if m in MODULES]
+            if not ids:
+                return
         outdir = self.output_root / self.target.replace(":", "_")
         outdir.mkdir(parents=True, exist_ok=True)
         self.log.clear(); self.pb.setValue(0)
-        self.runner = Runner(self.target, [i+1 for i in mids], outdir)
-        self.runner.log.connect(self.log.append)
-        self.runner.progress.connect(self.pb.setValue)
-        self.runner.done_all.connect(lambda p: QMessageBox.information(self, "Finished", f"All modules completed.Report: {p}"))
-        self.runner.start()
-
-    # ────────── Theme ──────────
-    def _apply_theme(self):
-        self.setStyleSheet(textwrap.dedent("""
-            * { background:#1e1e1e; color:#dcdcdc; font-family:Arial,Helvetica,sans-serif; }
-            QPushButton { background:#333; border:1px solid #444; padding:6px 12px; }
-            QPushButton:hover { background:#444; }
-            QPushButton:disabled { background:#555; color:#888; }
-            QTextEdit, QListWidget { background:#121212; }
-            QProgressBar { background:#121212; border:1px solid #444; text-align:center; }
-        """))
+        self.pool.setMaxThreadCount(self.spin_workers.value())
+        self.ctx = RunContext(self.target, len(ids), outdir, self.signals,
+                              ignore_cache=self.chk_nocache.isChecked())
+        for mid in ids:
+            self.pool.start(ModuleJob(mid, self.ctx))
+
+    def _on_done_all(self, path: Path):
+        QMessageBox.information(self, "Finished", f"All modules completed.Report: {path}")
 
 # ────────────────────────────── Application entry ────────────────────────────
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(_THEME_QSS)
     win = MainWindow()
     win.show()
     sys.exit(app.exec_())
\ No newline at end of file